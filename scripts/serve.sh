@@ -0,0 +1,24 @@
+#!/usr/bin/env bash
+# Runs the Mirror Ledger API for deployment (no auto-reload).
+#
+# The server runs as a single process on purpose: each worker process would load its own
+# in-memory copy of data/master_ledger.jsonl and append to the file independently,
+# forking the chain. Concurrency comes from the async endpoints instead (LLM calls are
+# awaited, so one process keeps many requests in flight). --limit-concurrency bounds the
+# work in flight; requests beyond it get a 503 instead of queueing without limit.
+# The event loop is uvloop (libuv-based, faster than the default asyncio loop).
+#
+# Usage: scripts/serve.sh   (override HOST, PORT, LIMIT_CONCURRENCY via environment)
+set -euo pipefail
+
+HOST="${HOST:-0.0.0.0}"
+PORT="${PORT:-8000}"
+LIMIT_CONCURRENCY="${LIMIT_CONCURRENCY:-256}"
+
+exec uvicorn mirror_ledger.api.server:app \
+    --host "$HOST" \
+    --port "$PORT" \
+    --workers 1 \
+    --loop uvloop \
+    --limit-concurrency "$LIMIT_CONCURRENCY" \
+    --timeout-keep-alive 5
@@ -8,4 +8,6 @@ setup(
     package_dir={"": "src"},
     # This finds all packages (like 'api', 'blockchain') inside the 'src' directory
     packages=find_packages(where="src"),
+    # dataclass(slots=True) on Block requires Python 3.10+
+    python_requires=">=3.10",
 )
\ No newline at end of file
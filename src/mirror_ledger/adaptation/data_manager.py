@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from mirror_ledger.blockchain.utils import dumps_line
 
 # NOTE: The ledger interface we expect:
-#   - ledger.iter_blocks() -> Iterable[Block]
+#   - ledger.iter_blocks_from(start, event_type=...) -> Iterable[Block] (in chain order)
+#   - ledger.find_by_feedback_status(status) -> List[Block] (in chain order)
 #   - Each Block has .data (dict) and .feedback (dict)
 #   - IntakeDrafted blocks: data = {
 #       "type":"IntakeDrafted",
@@ -35,30 +37,14 @@ class TrainingPair:
     adapter_hint: Optional[str] = None  # e.g., prior adapter in use
 
 
-def _is_intake_block(b: Any) -> bool:
-    return isinstance(b.data, dict) and b.data.get("type") == "IntakeDrafted"
-
-
-def _correction_from_feedback(fb: Dict[str, Any]) -> str:
-    """
-    We allow two ways to supply corrections:
-      - fb["correction"] (preferred, structured in the future)
-      - fb["notes"] (fallback for free-text)
-    """
-    if not fb:
-        return ""
-    if isinstance(fb.get("correction"), str) and fb["correction"].strip():
-        return fb["correction"].strip()
-    if isinstance(fb.get("notes"), str):
-        return fb["notes"].strip()
-    return ""
+# Shared read-only fallback for missing dicts, so the hot loop doesn't allocate `{}` per block.
+_EMPTY: Dict[str, Any] = {}
 
+# Input keys that survive de-identification.
+_ALLOWED_INPUT_KEYS = frozenset({"vitals", "hpi_summary"})
 
-def _labels_from_feedback(fb: Dict[str, Any]) -> List[str]:
-    if not fb:
-        return []
-    labels = fb.get("labels") or []
-    return [str(x) for x in labels if isinstance(x, (str, int))]
+# Size of write_jsonl's output buffer.
+_WRITE_BUFFER_BYTES = 256 * 1024
 
 
 def _deidentify(pair: TrainingPair) -> TrainingPair:
@@ -67,8 +53,20 @@ def _deidentify(pair: TrainingPair) -> TrainingPair:
       - drop patient_id / encounter_id from inputs
       - keep vitals and hpi_summary
     Expand this as needed for your compliance profile.
+
+    Inputs that already contain only well-typed allowed keys (what
+    extract_training_pairs builds) are returned as-is, without a copy.
     """
-    _in = dict(pair.input or {})
+    _in = pair.input
+    if (
+        isinstance(_in, dict)
+        and _in.keys() <= _ALLOWED_INPUT_KEYS
+        and isinstance(_in.get("vitals", _EMPTY), dict)
+        and isinstance(_in.get("hpi_summary", ""), str)
+    ):
+        return pair
+
+    _in = _in or _EMPTY
     # defensive: ensure we only keep allowed keys
     keep = {}
     if isinstance(_in.get("vitals"), dict):
@@ -86,34 +84,59 @@ def _deidentify(pair: TrainingPair) -> TrainingPair:
     )
 
 
-def extract_training_pairs(ledger, since_index: int = 0, only_status: Optional[str] = "approved") -> List[TrainingPair]:
+def _pair_to_dict(tp: TrainingPair) -> Dict[str, Any]:
+    # Same shape as dataclasses.asdict(tp), without its recursive deep copy.
+    return {
+        "trace_id": tp.trace_id,
+        "input": tp.input,
+        "labels": tp.labels,
+        "correction": tp.correction,
+        "annotator": tp.annotator,
+        "adapter_hint": tp.adapter_hint,
+    }
+
+
+def extract_training_pairs(ledger, since_index: int = 0, only_status: Optional[str] = "approved") -> Iterator[TrainingPair]:
     """
     Collect pairs from the ledger:
-      - Start with IntakeDrafted blocks
+      - Start with IntakeDrafted blocks at or after since_index
       - Use their mutable feedback tail to find labels/corrections
       - Optionally filter to feedback.status == only_status (default "approved")
 
-    Returns a list of TrainingPair.
+    Corrections come from fb["correction"] (preferred, structured in the future) or
+    fb["notes"] (fallback for free-text).
+
+    Yields TrainingPair lazily; wrap in list() if you need to reuse them.
     """
-    pairs: List[TrainingPair] = []
-    for b in ledger.iter_blocks():
-        if b.index < since_index:
-            continue
-        if not _is_intake_block(b):
-            continue
+    # The helpers for labels/corrections are inlined below: this loop runs once per
+    # IntakeDrafted block, so per-block call overhead adds up on large ledgers.
+    if only_status is None:
+        blocks = ledger.iter_blocks_from(since_index, event_type="IntakeDrafted")
+    else:
+        # Blocks with a given review status are usually far fewer than all intake drafts.
+        blocks = (
+            b for b in ledger.find_by_feedback_status(only_status)
+            if b.index >= since_index and (b.data or _EMPTY).get("type") == "IntakeDrafted"
+        )
+
+    for b in blocks:
+        fb = b.feedback or _EMPTY
 
-        fb = b.feedback or {}
-        if only_status is not None:
-            if fb.get("status") != only_status:
-                continue
+        raw_labels = fb.get("labels")
+        labels = [str(x) for x in raw_labels if isinstance(x, (str, int))] if raw_labels else []
+
+        corr = fb.get("correction")
+        if isinstance(corr, str) and corr.strip():
+            corr = corr.strip()
+        else:
+            notes = fb.get("notes")
+            corr = notes.strip() if isinstance(notes, str) else ""
 
-        labels = _labels_from_feedback(fb)
-        corr = _correction_from_feedback(fb)
         if not labels and not corr:
             # nothing to learn from yet
             continue
 
-        data = b.data or {}
+        data = b.data or _EMPTY
         pair = TrainingPair(
             trace_id=str(data.get("trace_id", "")),
             input={
@@ -125,36 +148,44 @@ def extract_training_pairs(ledger, since_index: int = 0, only_status: Optional[s
             },
             labels=labels,
             correction=corr,
-            annotator=(b.feedback or {}).get("annotator"),
-            adapter_hint=(data.get("model") or {}).get("adapter_id"),
+            annotator=fb.get("annotator"),
+            adapter_hint=(data.get("model") or _EMPTY).get("adapter_id"),
         )
 
-        pairs.append(_deidentify(pair))
-
-    return pairs
+        yield _deidentify(pair)
 
 
-def write_jsonl(dataset_path: str | Path, pairs: List[TrainingPair]) -> str:
+def write_jsonl(dataset_path: str | Path, pairs: Iterable[TrainingPair]) -> str:
     """
     Persist training pairs to a JSONL file (one example per line).
     Returns the absolute path to the dataset.
+
+    Pairs are consumed one at a time, so a generator (e.g. extract_training_pairs) is
+    streamed to disk without materializing the dataset. Lines go through a 256 KiB
+    write buffer.
     """
     p = Path(dataset_path).absolute()
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
+    with p.open("wb", buffering=_WRITE_BUFFER_BYTES) as f:
         for tp in pairs:
-            f.write(json.dumps(asdict(tp), ensure_ascii=False) + "\n")
+            f.write(dumps_line(_pair_to_dict(tp)))
     return str(p)
 
 
-def summarize_pairs(pairs: List[TrainingPair]) -> Dict[str, Any]:
+def summarize_pairs(pairs: Iterable[TrainingPair]) -> Dict[str, Any]:
     """
     Simple metrics to help policies decide:
       - n_pairs
       - labeled_count (has labels)
       - corrected_count (has correction)
+
+    Computed in a single pass, so a generator of pairs can be summarized directly.
     """
-    n = len(pairs)
-    labeled = sum(1 for x in pairs if x.labels)
-    corrected = sum(1 for x in pairs if x.correction)
+    n = labeled = corrected = 0
+    for x in pairs:
+        n += 1
+        if x.labels:
+            labeled += 1
+        if x.correction:
+            corrected += 1
     return {"n_pairs": n, "labeled_count": labeled, "corrected_count": corrected}
@@ -5,16 +5,34 @@
 For now, it uses a simple feedback counter.
 """
 
+import logging
+
+logger = logging.getLogger(__name__)
+
+
 class SEALPolicy:
-    def __init__(self, feedback_threshold: int = 5):
+    def __init__(self, feedback_threshold: int = 5, feedback_count: int = 0):
+        """
+        Args:
+            feedback_threshold: Number of corrections that triggers an adaptation.
+            feedback_count: Corrections already recorded since the last adaptation, e.g.
+                as rebuilt from the ledger on startup.
+        """
         self.feedback_threshold = feedback_threshold
-        self.feedback_count = 0
-        print(f"Initialized STUB SEALPolicy with threshold: {self.feedback_threshold}")
+        self.feedback_count = feedback_count
+        logger.info("Initialized STUB SEALPolicy with threshold: %d", self.feedback_threshold)
+
+    @property
+    def corrections_since_adaptation(self) -> int:
+        """Corrections recorded since the last adaptation was triggered."""
+        return self.feedback_count
 
     def record_feedback(self) -> bool:
         """Increments feedback counter and checks if threshold is met."""
         self.feedback_count += 1
-        print(f"Policy: Feedback recorded. Count is now {self.feedback_count}/{self.feedback_threshold}")
+        # This runs on every feedback request; skip formatting when debug logging is off.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Policy: Feedback recorded. Count is now %d/%d", self.feedback_count, self.feedback_threshold)
         if self.feedback_count >= self.feedback_threshold:
             self.reset()
             return True # Trigger adaptation
@@ -22,5 +40,5 @@ class SEALPolicy:
 
     def reset(self):
         """Resets the counter after triggering adaptation."""
-        print("Policy: Threshold met. Resetting feedback counter to 0.")
-        self.feedback_count = 0
\ No newline at end of file
+        logger.info("Policy: Threshold met. Resetting feedback counter to 0.")
+        self.feedback_count = 0
@@ -1,7 +1,7 @@
 # mirror_ledger/api/schemas.py
 
 from pydantic import BaseModel, Field
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 """
 This module defines the Pydantic models that serve as the data contracts for our API.
@@ -57,6 +57,15 @@ class ChainResponse(BaseModel):
     Schema for returning the entire blockchain or a subset of it.
     """
     chain: List[BlockResponse]
+    next_cursor: Optional[int] = Field(None, description="Pass as `since_index` to fetch the next page; null when there are no more blocks.")
+
+class AdaptationStatusResponse(BaseModel):
+    """
+    Schema for the adaptation loop's progress towards its next trigger.
+    """
+    last_adapt_index: Optional[int] = Field(None, description="Index of the latest AdapterPromoted block, if any.")
+    corrections_since: int = Field(..., description="Corrections recorded by the policy since the last adaptation.")
+    threshold: int = Field(..., description="Corrections needed to trigger the next adaptation.")
 
 class GeneralResponse(BaseModel):
     """
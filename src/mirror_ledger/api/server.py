@@ -1,13 +1,15 @@
 # src/mirror_ledger/api/server.py
 
+import asyncio
 from fastapi import FastAPI, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 # Use absolute imports from the package root
 from mirror_ledger.blockchain.ledger import BlockchainLedger
-from mirror_ledger.llm.base_model import Generator
+from mirror_ledger.llm.base_model import Generator, create_http_client
 from mirror_ledger.llm.reflection_model import Reflector
 from mirror_ledger.adaptation.policy import SEALPolicy
 from mirror_ledger.api import schemas
@@ -16,6 +18,34 @@ from mirror_ledger.api import schemas
 # This acts as a simple, reliable state manager for the app.
 app_state = {}
 
+# Ledger appends are buffered up to this many bytes and pushed to the OS at least every
+# _LEDGER_FLUSH_INTERVAL_S; they are fsynced on /validate and on shutdown.
+_LEDGER_WRITE_BUFFER = 64 * 1024
+_LEDGER_FLUSH_INTERVAL_S = 0.010
+
+
+async def _flush_ledger_periodically(ledger: BlockchainLedger) -> None:
+    """Background task bounding how long a buffered ledger write can stay in memory."""
+    while True:
+        await asyncio.sleep(_LEDGER_FLUSH_INTERVAL_S)
+        ledger.flush()
+
+
+def _count_corrections_since_adaptation(ledger: BlockchainLedger) -> int:
+    """
+    Counts the correction submissions logged after the last AdapterPromoted block. This is
+    the persisted value of the policy's feedback counter, which counts every submission.
+    """
+    last_adapt = ledger.last_block_of_type("AdapterPromoted")
+    # Block timestamps and feedback record times are both utc_iso() strings, so they
+    # order correctly as strings.
+    since = last_adapt.timestamp if last_adapt else ""
+    return sum(
+        1 for record in ledger.iter_feedback_log()
+        if "correction" in record["delta"] and record["ts"] > since
+    )
+
+
 # The 'lifespan' manager is the modern way to handle startup/shutdown events.
 # This code will run inside the Uvicorn worker process, solving the reloader issue.
 @asynccontextmanager
@@ -26,16 +56,21 @@ async def lifespan(app: FastAPI):
 
     try:
         # Initialize all our components
-        master_ledger = BlockchainLedger(storage_path="data/master_ledger.jsonl")
-        llm_generator = Generator(model_name="phi3:mini")
+        master_ledger = BlockchainLedger(storage_path="data/master_ledger.jsonl", write_buffer_size=_LEDGER_WRITE_BUFFER)
+        # One pooled HTTP client for the process, so Ollama calls reuse keep-alive connections.
+        http_client = create_http_client()
+        llm_generator = Generator(model_name="phi3:mini", client=http_client)
         llm_reflector = Reflector(model_name="gemini-1.5-flash")
-        adaptation_policy = SEALPolicy(feedback_threshold=3)
+        # The counter is rebuilt from the feedback log, so /adaptation/status survives restarts.
+        adaptation_policy = SEALPolicy(feedback_threshold=3, feedback_count=_count_corrections_since_adaptation(master_ledger))
 
         # Store the live components in our state dictionary
+        app_state["http"] = http_client
         app_state["ledger"] = master_ledger
         app_state["generator"] = llm_generator
         app_state["reflector"] = llm_reflector
         app_state["policy"] = adaptation_policy
+        app_state["ledger_flusher"] = asyncio.create_task(_flush_ledger_periodically(master_ledger))
 
         print(f"--- Components Initialized and Ready ---")
         print(f"Ledger has {len(master_ledger.chain)} blocks.")
@@ -48,6 +83,10 @@ async def lifespan(app: FastAPI):
 
     # --- Code to run ONCE on shutdown ---
     print("--- Lifespan Event: Shutting down. ---")
+    app_state["ledger_flusher"].cancel()
+    app_state["ledger"].close()  # Flushes and fsyncs any buffered writes
+    await app_state["generator"].aclose()
+    await app_state["http"].aclose()
     app_state.clear()
 
 
@@ -79,10 +118,28 @@ def get_policy() -> SEALPolicy:
 # (This section is unchanged)
 
 @app.get("/chain", response_model=schemas.ChainResponse, tags=["Blockchain"])
-def get_full_chain(trace_id: Optional[str]=Query(None, description="Filter blocks by a specific trace_id."), ledger: BlockchainLedger=Depends(get_ledger)):
+def get_full_chain(
+    trace_id: Optional[str]=Query(None, description="Filter blocks by a specific trace_id."),
+    since_index: int=Query(0, ge=0, description="Only return blocks with at least this index."),
+    limit: Optional[int]=Query(None, ge=1, description="Maximum number of blocks to return (default: all)."),
+    ledger: BlockchainLedger=Depends(get_ledger)
+):
     if trace_id:
-        return {"chain": ledger.find_by_trace_id(trace_id)}
-    return {"chain": ledger.chain}
+        matches = [b for b in ledger.find_by_trace_id(trace_id) if b.index >= since_index]
+        page = matches if limit is None else matches[:limit]
+        has_more = len(page) < len(matches)
+    else:
+        chain = ledger.chain
+        end = len(chain) if limit is None else min(since_index + limit, len(chain))
+        page = chain[since_index:end]
+        has_more = end < len(chain)
+    return {"chain": page, "next_cursor": page[-1].index + 1 if has_more else None}
+
+@app.get("/chain/stream", tags=["Blockchain"])
+def stream_chain(since_index: int=Query(0, ge=0, description="Only stream blocks with at least this index."), ledger: BlockchainLedger=Depends(get_ledger)):
+    # NDJSON, one block per line, serialized as it is sent: memory stays flat and the
+    # first bytes go out immediately, however long the chain is.
+    return StreamingResponse(ledger.iter_jsonl(since_index), media_type="application/x-ndjson")
 
 @app.get("/block/{index}", response_model=schemas.BlockResponse, tags=["Blockchain"])
 def get_block_by_index(index: int, ledger: BlockchainLedger=Depends(get_ledger)):
@@ -92,17 +149,18 @@ def get_block_by_index(index: int, ledger: BlockchainLedger=Depends(get_ledger))
         raise HTTPException(status_code=404, detail=f"Block with index {index} not found.")
 
 @app.post("/events/intake_drafted", response_model=schemas.BlockResponse, status_code=201, tags=["Events"])
-def create_intake_event(
+async def create_intake_event(
     request: schemas.IntakeDraftRequest,
     ledger: BlockchainLedger = Depends(get_ledger),
     generator: Generator = Depends(get_generator),
     reflector: Reflector = Depends(get_reflector)
 ):
-    draft_content = generator.generate_intake(
+    # The LLM calls are awaited, so other requests are served while they are in flight.
+    draft_content = await generator.generate_intake(
         transcript=request.content.get("transcript", ""),
         vitals=request.content.get("vitals", {})
     )
-    evaluation = reflector.judge(draft_content)
+    evaluation = await reflector.judge(draft_content)
     if not evaluation.get("ok"):
         raise HTTPException(
             status_code=400,
@@ -123,7 +181,7 @@ def create_intake_event(
     return new_block
 
 @app.post("/feedback", response_model=schemas.BlockResponse, tags=["Feedback"])
-def submit_feedback(
+async def submit_feedback(
     request: schemas.FeedbackRequest,
     ledger: BlockchainLedger = Depends(get_ledger),
     policy: SEALPolicy = Depends(get_policy)
@@ -145,9 +203,21 @@ def submit_feedback(
     except IndexError:
         raise HTTPException(status_code=404, detail=f"Block with index {request.block_index} not found.")
 
+@app.get("/adaptation/status", response_model=schemas.AdaptationStatusResponse, tags=["Adaptation"])
+def get_adaptation_status(ledger: BlockchainLedger=Depends(get_ledger), policy: SEALPolicy=Depends(get_policy)):
+    # Both values are maintained incrementally (type index, policy counter); no chain scan.
+    # The counter is rebuilt from the feedback log on startup (see _count_corrections_since_adaptation).
+    last_adapt = ledger.last_block_of_type("AdapterPromoted")
+    return {
+        "last_adapt_index": last_adapt.index if last_adapt else None,
+        "corrections_since": policy.corrections_since_adaptation,
+        "threshold": policy.feedback_threshold,
+    }
+
 @app.get("/validate", response_model=schemas.GeneralResponse, tags=["Blockchain"])
 def validate_the_chain(ledger: BlockchainLedger=Depends(get_ledger)):
     try:
+        ledger.flush(sync=True)
         ledger.validate_chain()
         return {"status": "ok", "message": f"Chain with {len(ledger.chain)} blocks is valid."}
     except ValueError as e:
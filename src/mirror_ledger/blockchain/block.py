@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from json.encoder import encode_basestring_ascii
 from typing import Dict, Any
-from .utils import sha256_hex, deterministic_dumps, utc_iso
+from .utils import sha256_hex_bytes, deterministic_dumps, utc_iso
 
 
-@dataclass
+# Fixed fragments of the canonical core layout used by `Block.core_bytes`: the keys of
+# `core_dict()` in sorted order, exactly as `deterministic_dumps` would emit them.
+_CORE_DATA_KEY = '{"data":'
+_CORE_INDEX_KEY = ',"index":'
+_CORE_PREVIOUS_HASH_KEY = ',"previous_hash":'
+_CORE_TIMESTAMP_KEY = ',"timestamp":'
+
+
+@dataclass(slots=True)
 class Block:
     """
     A blockchain block designed for event-sourcing and clear separation between an
@@ -25,6 +34,9 @@ class Block:
 
     The block's hash is computed deterministically from its immutable core, ensuring
     tamper-evidence for the recorded event.
+
+    Blocks use `__slots__` (no per-instance `__dict__`), which keeps the in-memory chain
+    compact; ad-hoc attributes cannot be attached to a Block.
     """
     index: int
     previous_hash: str
@@ -46,6 +58,30 @@ class Block:
         """
         self.hash = self.compute_hash()
 
+    @classmethod
+    def from_trusted(
+        cls,
+        index: int,
+        previous_hash: str,
+        timestamp: str,
+        data: Dict[str, Any],
+        feedback: Dict[str, Any],
+        hash_: str,
+    ) -> Block:
+        """
+        Builds a Block with a known hash, bypassing `__post_init__` and therefore the
+        serialization + SHA-256 of the core. Intended for rehydrating blocks from storage,
+        where the stored hash is verified later by `assert_hash_consistent`.
+        """
+        block = object.__new__(cls)
+        block.index = index
+        block.previous_hash = previous_hash
+        block.timestamp = timestamp
+        block.data = data
+        block.feedback = feedback
+        block.hash = hash_
+        return block
+
     def core_dict(self) -> Dict[str, Any]:
         """
         Returns a dictionary containing only the fields covered by the block hash.
@@ -59,13 +95,30 @@ class Block:
             "data": self.data,
         }
 
+    def core_bytes(self) -> bytes:
+        """
+        Returns the canonical serialization of the immutable core, as hashed by
+        `compute_hash`.
+
+        The output is byte-identical to `deterministic_dumps(self.core_dict())`, but only
+        the `data` payload goes through the JSON encoder: the fixed top-level fields are
+        laid out directly in sorted-key order, so no intermediate dict is built or sorted.
+        Canonical JSON is ASCII-only, so encoding to bytes is a plain copy.
+        """
+        return "".join((
+            _CORE_DATA_KEY, deterministic_dumps(self.data),
+            _CORE_INDEX_KEY, str(self.index),
+            _CORE_PREVIOUS_HASH_KEY, encode_basestring_ascii(self.previous_hash),
+            _CORE_TIMESTAMP_KEY, encode_basestring_ascii(self.timestamp),
+            "}",
+        )).encode("ascii")
+
     def compute_hash(self) -> str:
         """
-        Computes the block's SHA-256 hash from its immutable core dictionary.
-        Uses a deterministic JSON dump to ensure consistent output.
+        Computes the block's SHA-256 hash from its immutable core.
+        Uses a deterministic JSON serialization to ensure consistent output.
         """
-        core_json = deterministic_dumps(self.core_dict())
-        return sha256_hex(core_json)
+        return sha256_hex_bytes(self.core_bytes())
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -109,14 +162,13 @@ class Block:
         new_feedback = dict(self.feedback or {})
         new_feedback.update(feedback_delta or {})
 
-        # Create a new block with the same core data but new feedback
-        new_block = Block(
+        # Create a new block with the same core data but new feedback. The core is
+        # unchanged, so the original hash is carried over instead of being recomputed.
+        return Block.from_trusted(
             index=self.index,
             previous_hash=self.previous_hash,
-            data=self.data,
             timestamp=self.timestamp,
+            data=self.data,
             feedback=new_feedback,
-        )
-        # Manually set the hash to the original, as the core is unchanged.
-        new_block.hash = self.hash
-        return new_block
\ No newline at end of file
+            hash_=self.hash,
+        )
\ No newline at end of file
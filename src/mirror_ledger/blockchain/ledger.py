@@ -1,12 +1,21 @@
 # mirror_ledger/blockchain/ledger.py
 
 from __future__ import annotations
-import json
+import logging
+import mmap
+import os
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Sequence
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Iterable, Optional
+from typing import Dict, Any, List, Iterable, Iterator, Optional, BinaryIO
 
 from .block import Block
-from .utils import utc_iso
+from .utils import dumps_line, loads_line, utc_iso
+
+logger = logging.getLogger(__name__)
 
 """
 This module implements the BlockchainLedger, the primary controller for the chain.
@@ -18,17 +27,104 @@ Design Choices:
     serialized block. This format is human-readable, easily auditable with standard
     command-line tools (like `grep` or `jq`), and robust against corruption (a single
     corrupt line doesn't invalidate the whole file).
-  - Persistence Strategy: For simplicity and safety in this prototype stage, feedback
-    updates trigger a full rewrite of the storage file (`_rewrite_file`). This is an atomic
-    operation (writing to a temporary file then replacing the original) that prevents data
-    loss if the process is interrupted. For high-throughput systems, this could be
-    optimized or replaced with a transactional database (e.g., SQLite, Postgres)
-    without changing the public API of this class.
+  - Persistence Strategy: Feedback updates are appended as small delta records to a
+    sidecar log (`<name>.feedback.jsonl`) instead of rewriting the whole chain, so the
+    cost of a feedback write is proportional to the delta, not the ledger size. The
+    sidecar is replayed on load, and `compact()` folds it back into the main file via an
+    atomic rewrite (writing to a temporary file then replacing the original). For
+    high-throughput systems, this could be replaced with a transactional database
+    (e.g., SQLite, Postgres) without changing the public API of this class.
   - In-Memory Cache: The entire chain is held in a list (`self._chain`) for fast,
     synchronous access and querying. The file on disk is the source of truth for
-    durability.
+    durability. Secondary indexes map `trace_id` and event `type` to block indices so
+    lookups don't scan the chain.
 """
 
+# The Genesis block's previous_hash is defined by convention as 64 zeros.
+_GENESIS_PREVIOUS_HASH = "0" * 64
+# The payload of the Genesis block created for a new ledger. Its timestamp is still the
+# creation time, so each ledger's genesis hash stays unique.
+_GENESIS_DATA = {"type": "Genesis", "message": "Mirror Ledger initialized."}
+
+
+def _intern_field(mapping: Dict[str, Any], key: str) -> Any:
+    """
+    Replaces a string value in `mapping` with its interned copy and returns it. Fields like
+    `type` and `status` take a handful of distinct values across the whole chain, so every
+    block can share one string object instead of each holding its own decoded copy.
+    """
+    value = mapping.get(key)
+    if isinstance(value, str):
+        value = mapping[key] = sys.intern(value)
+    return value
+
+
+def _fsync_dir(path: Path) -> None:
+    """Fsyncs a directory, making renames and unlinks of its entries durable."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _atomic_write(path: Path, chunks: Iterable[bytes]) -> None:
+    """
+    Replaces `path` with `chunks` via a temporary file that is fsynced before the rename;
+    the directory is fsynced after it, so a crash leaves either the old or the new file.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.writelines(chunks)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(path)
+    _fsync_dir(path.parent)
+
+
+def _iter_jsonl_records(path: Path) -> Iterator[Any]:
+    """
+    Yields the parsed records of a JSON Lines file, skipping blank lines.
+
+    The file is memory-mapped and split on newlines, so each record is parsed straight
+    from its raw bytes; no text decoding pass or per-line `str` objects are involved.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = 0, len(mm)
+            while start < end:
+                nl = mm.find(b"\n", start)
+                if nl == -1:
+                    nl = end
+                line = mm[start:nl]
+                start = nl + 1
+                if line and not line.isspace():
+                    yield loads_line(line)
+
+
+class _ChainView(Sequence):
+    """
+    A read-only, zero-copy view over the ledger's in-memory chain. Indexing, slicing,
+    `len()` and iteration go straight to the underlying list; there is no way to mutate
+    the chain through it.
+    """
+    __slots__ = ("_blocks",)
+
+    def __init__(self, blocks: List[Block]) -> None:
+        self._blocks = blocks
+
+    def __getitem__(self, index):
+        return self._blocks[index]
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __iter__(self):
+        return iter(self._blocks)
+
+
 class BlockchainLedger:
     """
     Manages the collection of blocks, ensuring integrity and providing methods for
@@ -36,26 +132,65 @@ class BlockchainLedger:
     AI's entire event history.
     """
 
-    def __init__(self, storage_path: str = "data/blocks.jsonl", auto_bootstrap_genesis: bool = True) -> None:
+    def __init__(self, storage_path: str = "data/blocks.jsonl", auto_bootstrap_genesis: bool = True, write_buffer_size: int = 0) -> None:
         """
         Initializes the ledger. If a storage file exists, it loads the chain from disk.
         Otherwise, it creates the storage file and, if requested, a Genesis Block.
+
+        By default every block and feedback record is written to the OS as it is added.
+        With `write_buffer_size` > 0, writes are collected in a buffer of that many bytes
+        and reach the file when it fills or on `flush()`, trading a window of unflushed
+        records on a crash for far fewer syscalls under load.
         """
         self.path = Path(storage_path)
+        self.write_buffer_size = write_buffer_size
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Sidecar log of feedback deltas, e.g. data/blocks.jsonl -> data/blocks.feedback.jsonl
+        self.fb_path = self.path.with_suffix(".feedback.jsonl")
+        self._fb_fp: Optional[BinaryIO] = None
         self._chain: List[Block] = []
+        # Secondary indexes: trace_id / event type -> block indices, in chain order.
+        self._by_trace: Dict[str, List[int]] = defaultdict(list)
+        self._by_type: Dict[str, List[int]] = defaultdict(list)
+        # Feedback status (e.g. "approved") -> block indices currently in that status. The
+        # inner dict is used as an ordered set, since a block's status can change.
+        self._by_status: Dict[str, Dict[int, None]] = defaultdict(dict)
 
         if self.path.exists():
             self._load_from_file()
-        else:
-            self.path.touch() # Create an empty file
+
+        # A persistent append handle (also creates the file if it is missing), so adding a
+        # block costs a single write() rather than an open/write/close.
+        self._append_fp: BinaryIO = self._open_for_append(self.path)
 
         if auto_bootstrap_genesis and not self._chain:
-            # The Genesis block's previous_hash is defined by convention as 64 zeros.
-            self.add_block(
-                data={"type": "Genesis", "message": "Mirror Ledger initialized."},
-                is_genesis=True
-            )
+            self.add_block(data=dict(_GENESIS_DATA), is_genesis=True)
+
+    def flush(self, sync: bool = False) -> None:
+        """
+        Pushes any buffered blocks and feedback records to the OS. With `sync`, also
+        fsyncs both files so everything written so far is durable.
+        """
+        for fp in (self._append_fp, self._fb_fp):
+            if fp is None:
+                continue
+            fp.flush()
+            if sync:
+                os.fsync(fp.fileno())
+
+    def close(self) -> None:
+        """Makes pending writes durable and closes the file handles held by the ledger."""
+        self.flush(sync=True)
+        self._append_fp.close()
+        if self._fb_fp is not None:
+            self._fb_fp.close()
+            self._fb_fp = None
+
+    def __enter__(self) -> BlockchainLedger:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # --- Public API: Write Operations ---
 
@@ -74,7 +209,7 @@ class BlockchainLedger:
         """
         if is_genesis:
             index = 0
-            previous_hash = "0" * 64
+            previous_hash = _GENESIS_PREVIOUS_HASH
         else:
             if not self._chain:
                 raise RuntimeError("Cannot add a non-genesis block to an empty chain.")
@@ -91,6 +226,40 @@ class BlockchainLedger:
         self._append_to_file(block)
         return block
 
+    def add_blocks(self, datas: Iterable[Dict[str, Any]]) -> List[Block]:
+        """
+        Appends a batch of new blocks with a single write and a single `fsync`. Use this
+        for bulk ingestion, where per-block writes would dominate.
+
+        The blocks are chained in order after the current tip. Nothing is added to the
+        in-memory chain unless the whole batch was written.
+
+        Args:
+            datas: The core event payloads, one per block.
+
+        Returns:
+            The newly created and persisted Blocks, in chain order.
+        """
+        if not self._chain:
+            raise RuntimeError("Cannot add a non-genesis block to an empty chain.")
+
+        blocks: List[Block] = []
+        prev = self._chain[-1]
+        for data in datas:
+            prev = Block(index=prev.index + 1, previous_hash=prev.hash, data=data)
+            blocks.append(prev)
+        if not blocks:
+            return blocks
+
+        self._append_fp.write(b"".join(dumps_line(b.to_dict()) for b in blocks))
+        self._append_fp.flush()
+        os.fsync(self._append_fp.fileno())
+
+        for block in blocks:
+            self._chain.append(block)
+            self._index_block(block)
+        return blocks
+
     def append_feedback(self, index: int, feedback_delta: Dict[str, Any]) -> Block:
         """
         Merges feedback into the block at `index` without changing its hash. This is the
@@ -109,25 +278,80 @@ class BlockchainLedger:
         if index < 0 or index >= len(self._chain):
             raise IndexError(f"Block index {index} out of range (0..{len(self._chain)-1})")
 
+        if isinstance(feedback_delta.get("status"), str):
+            feedback_delta = dict(feedback_delta)
+            _intern_field(feedback_delta, "status")
+
+        # Logged before it is applied, so a delta that can't be written never exists in memory.
+        self._append_feedback_to_file(index, feedback_delta)
+
         original_block = self._chain[index]
         updated_block = original_block.clone_with_feedback(feedback_delta)
-
-        # Atomically update the state
         self._chain[index] = updated_block
-        self._rewrite_file()
+        self._reindex_status(index, original_block.feedback.get("status"), updated_block.feedback.get("status"))
         return updated_block
 
+    def compact(self) -> None:
+        """
+        Folds the feedback sidecar log into the main storage file and truncates the log.
+
+        The main file is rewritten atomically and made durable before the sidecar is
+        cleared. If the process stops in between, replaying the (already merged) deltas on
+        the next load yields the same feedback, so the operation is safe to retry.
+        """
+        self._rewrite_file()
+        if self._fb_fp is not None:
+            self._fb_fp.close()
+            self._fb_fp = None
+        self.fb_path.unlink(missing_ok=True)
+        _fsync_dir(self.fb_path.parent)
+
     # --- Public API: Read and Validate Operations ---
 
     @property
-    def chain(self) -> List[Block]:
-        """Provides read-only access to the in-memory chain."""
+    def chain(self) -> Sequence[Block]:
+        """
+        Provides read-only access to the in-memory chain without copying it. The view
+        reflects blocks appended later; use `snapshot()` for a point-in-time copy.
+        """
+        return _ChainView(self._chain)
+
+    def snapshot(self) -> List[Block]:
+        """Returns a shallow copy of the chain as a list."""
         return list(self._chain)
 
     def iter_blocks(self) -> Iterable[Block]:
         """Returns an iterator over the blocks in the chain."""
         return iter(self._chain)
 
+    def iter_blocks_from(self, start: int, event_type: Optional[str] = None) -> Iterable[Block]:
+        """
+        Returns an iterator over the blocks with index >= `start`, without visiting the
+        blocks before it. Block indices equal their position in the chain.
+
+        Args:
+            start: The first block index to yield.
+            event_type: If given, only blocks of this event type are yielded (via the type index).
+        """
+        start = max(start, 0)
+        if event_type is None:
+            return islice(self._chain, start, None)
+        indices = self._by_type.get(event_type, [])
+        return (self._chain[i] for i in islice(indices, bisect_left(indices, start), None))
+
+    def iter_jsonl(self, start: int = 0) -> Iterator[bytes]:
+        """
+        Serializes the chain lazily as JSON Lines, one UTF-8 encoded record per block
+        (the same format as the storage file). Suitable for exports and streaming
+        responses: no copy of the chain or of the block dicts is made, and the output
+        is never held in memory as a whole.
+
+        Args:
+            start: The first block index to serialize (defaults to the whole chain).
+        """
+        for block in self.iter_blocks_from(start):
+            yield dumps_line(block.to_dict())
+
     def find_by_trace_id(self, trace_id: str) -> List[Block]:
         """
         Efficiently finds all blocks related to a specific workflow or event trace.
@@ -139,11 +363,53 @@ class BlockchainLedger:
         Returns:
             A list of all blocks sharing the given trace_id.
         """
-        # This list comprehension is efficient for in-memory searching.
-        return [
-            b for b in self._chain
-            if isinstance(b.data, dict) and b.data.get("trace_id") == trace_id
-        ]
+        return [self._chain[i] for i in self._by_trace.get(trace_id, ())]
+
+    def find_by_type(self, event_type: str) -> List[Block]:
+        """
+        Finds all blocks recording a given event type (e.g., "IntakeDrafted"), in chain order.
+
+        Args:
+            event_type: The value of the `type` field in the block data.
+
+        Returns:
+            A list of all blocks of the given type.
+        """
+        return [self._chain[i] for i in self._by_type.get(event_type, ())]
+
+    def last_block_of_type(self, event_type: str) -> Optional[Block]:
+        """
+        Returns the most recent block of a given event type, or None if there is none.
+
+        Args:
+            event_type: The value of the `type` field in the block data.
+        """
+        indices = self._by_type.get(event_type)
+        return self._chain[indices[-1]] if indices else None
+
+    def find_by_feedback_status(self, status: str) -> List[Block]:
+        """
+        Finds all blocks whose feedback currently has the given `status` (e.g., "approved"),
+        in chain order. Backed by an index kept up to date by `append_feedback`.
+
+        Args:
+            status: The value of the `status` field in the block feedback.
+
+        Returns:
+            A list of all blocks currently in that status.
+        """
+        return [self._chain[i] for i in sorted(self._by_status.get(status, ()))]
+
+    def iter_feedback_log(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the records of the feedback sidecar log in write order. Each holds the target
+        block's `index` and `hash`, the `delta` merged into its feedback and the write time
+        `ts`. Records already folded into the main file by `compact()` are not included.
+        """
+        if self._fb_fp is not None:
+            self._fb_fp.flush()
+        if self.fb_path.exists():
+            yield from _iter_jsonl_records(self.fb_path)
 
     def validate_chain(self) -> bool:
         """
@@ -164,7 +430,7 @@ class BlockchainLedger:
         # 1. Validate Genesis Block
         genesis = self._chain[0]
         genesis.assert_hash_consistent()
-        if genesis.index != 0 or genesis.previous_hash != "0" * 64:
+        if genesis.index != 0 or genesis.previous_hash != _GENESIS_PREVIOUS_HASH:
             raise ValueError("Genesis block is malformed.")
 
         # 2. Validate all subsequent blocks and their links
@@ -187,42 +453,119 @@ class BlockchainLedger:
     def _load_from_file(self) -> None:
         """Loads the chain from the .jsonl storage file into memory."""
         self._chain.clear()
-        with self.path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                obj = json.loads(line)
-                self._chain.append(self._block_from_dict(obj))
+        # Bound once: this loop runs once per stored block.
+        append, index_block, from_dict = self._chain.append, self._index_block, self._block_from_dict
+        prior_hash = None
+        for obj in _iter_jsonl_records(self.path):
+            block = from_dict(obj)
+            # Decoding gives every block its own copy of the previous block's hash. On an
+            # intact link, share the prior hash string instead (as add_block does), so
+            # each hash is held in memory once rather than twice.
+            if block.previous_hash == prior_hash:
+                block.previous_hash = prior_hash
+            prior_hash = block.hash
+            append(block)
+            index_block(block)
+        self._replay_feedback_log()
+
+    def _replay_feedback_log(self) -> None:
+        """
+        Merges the feedback deltas recorded in the sidecar log, in write order.
+
+        Each record names its target block by index and hash. Records whose block is not in
+        the main file (e.g. it was truncated or restored from an older copy) are dropped with
+        a warning, and the sidecar is rewritten without them: left in place, they would be
+        applied to whichever unrelated block later takes that index.
+        """
+        if not self.fb_path.exists():
+            return
+        kept: List[Dict[str, Any]] = []
+        dropped = 0
+        for record in _iter_jsonl_records(self.fb_path):
+            index, delta = int(record["index"]), record["delta"]
+            block = self._chain[index] if 0 <= index < len(self._chain) else None
+            # Records written before block hashes were logged carry no "hash" to check.
+            if block is None or record.get("hash", block.hash) != block.hash:
+                logger.warning("Dropping feedback record for missing block %d in %s", index, self.fb_path)
+                dropped += 1
+                continue
+            kept.append(record)
+            feedback = block.feedback
+            if "status" in delta:
+                self._reindex_status(index, feedback.get("status"), _intern_field(delta, "status"))
+            feedback.update(delta)
+        if dropped:
+            _atomic_write(self.fb_path, (dumps_line(record) for record in kept))
 
     def _rewrite_file(self) -> None:
         """Atomically rewrites the entire storage file with the current in-memory chain state."""
-        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
-        with tmp_path.open("w", encoding="utf-8") as f:
-            for block in self._chain:
-                f.write(json.dumps(block.to_dict()) + "\n")
-        tmp_path.replace(self.path)
+        _atomic_write(self.path, self.iter_jsonl())
+        # The old handle still points at the replaced file; reopen it on the new one.
+        self._append_fp.close()
+        self._append_fp = self._open_for_append(self.path)
 
     def _append_to_file(self, block: Block) -> None:
-        """Appends a single new block to the in-memory chain and the storage file."""
+        """Appends a single new block to the storage file and the in-memory chain."""
+        # Serialize and write first: if either fails, the in-memory chain stays as on disk.
+        self._write_record(self._append_fp, dumps_line(block.to_dict()))
         self._chain.append(block)
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(block.to_dict()) + "\n")
+        self._index_block(block)
+
+    def _append_feedback_to_file(self, index: int, feedback_delta: Dict[str, Any]) -> None:
+        """Appends a single feedback delta record to the sidecar log."""
+        if self._fb_fp is None:
+            self._fb_fp = self._open_for_append(self.fb_path)
+        record = {"index": index, "hash": self._chain[index].hash, "delta": feedback_delta, "ts": utc_iso()}
+        self._write_record(self._fb_fp, dumps_line(record))
+
+    def _write_record(self, fp: BinaryIO, line: bytes) -> None:
+        """Writes one serialized record, pushing it to the OS unless writes are buffered."""
+        fp.write(line)
+        if self.write_buffer_size <= 0:
+            fp.flush()
+
+    def _open_for_append(self, path: Path) -> BinaryIO:
+        """
+        Opens `path` for appending, with the configured write buffer or the default one.
+        The handle is always buffered: unlike a raw file, a buffered writer keeps writing
+        until a whole record is out, so a short write(2) can't leave a torn line behind.
+        """
+        return path.open("ab", buffering=self.write_buffer_size if self.write_buffer_size > 0 else -1)
+
+    def _index_block(self, block: Block) -> None:
+        """Registers a block in the trace_id, type and feedback status indexes."""
+        if block.feedback:
+            self._reindex_status(block.index, None, _intern_field(block.feedback, "status"))
+        if not isinstance(block.data, dict):
+            return
+        trace_id = block.data.get("trace_id")
+        if isinstance(trace_id, str):
+            self._by_trace[trace_id].append(block.index)
+        event_type = _intern_field(block.data, "type")
+        if isinstance(event_type, str):
+            self._by_type[event_type].append(block.index)
+
+    def _reindex_status(self, index: int, old_status: Any, new_status: Any) -> None:
+        """Moves a block between entries of the feedback status index."""
+        if old_status == new_status:
+            return
+        if isinstance(old_status, str):
+            self._by_status[old_status].pop(index, None)
+        if isinstance(new_status, str):
+            self._by_status[new_status][index] = None
 
     @staticmethod
     def _block_from_dict(obj: Dict[str, Any]) -> Block:
         """
         Rehydrates a Block object from its dictionary representation (as stored on disk).
-        It trusts the stored hash, which is later verified by `validate_chain`.
+        It trusts the stored hash, which is later verified by `validate_chain`, so the
+        hash is not recomputed here.
         """
-        b = Block(
+        return Block.from_trusted(
             index=int(obj["index"]),
             previous_hash=str(obj["previous_hash"]),
-            data=obj.get("data", {}),
             timestamp=str(obj["timestamp"]),
+            data=obj.get("data", {}),
             feedback=obj.get("feedback", {}),
+            hash_=str(obj["hash"]),
         )
-        # We must trust the stored hash during rehydration.
-        # The `validate_chain` method is responsible for verifying it.
-        b.hash = str(obj["hash"])
-        return b
\ No newline at end of file
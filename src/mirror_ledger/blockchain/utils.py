@@ -2,7 +2,13 @@
 
 import hashlib
 import json
-from datetime import datetime
+import time
+from typing import Any, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
 
 """
 This utility module provides foundational, stateless functions required by the blockchain components.
@@ -14,6 +20,14 @@ hashing process would invalidate the chain's verifiability. Therefore, this modu
 the same block data will *always* produce the same hash.
 """
 
+# json.dumps() builds a new JSONEncoder on every call when given non-default options;
+# the canonical encoder is stateless, so a single instance is shared instead.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+# The storage encoder escapes exactly like the canonical one (ASCII-only, NaN/Infinity kept
+# as literals, arbitrary-size ints), so whatever a block hash covers survives a round trip
+# through the file. Only key order differs.
+_STORAGE_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
 def deterministic_dumps(data: dict) -> str:
     """
     Serializes a dictionary into a deterministic JSON string.
@@ -29,14 +43,79 @@ def deterministic_dumps(data: dict) -> str:
     Returns:
         A sorted, compact JSON string representation of the data.
     """
-    return json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return _CANONICAL_ENCODER.encode(data)
 
-def sha256_hex(s: str) -> str:
+def dumps_line(obj: Any) -> bytes:
+    """
+    Serializes an object into a single newline-terminated JSON Lines record.
+
+    This is the storage encoding (not the hashing encoding, see `deterministic_dumps`). It
+    uses the stdlib encoder on purpose: `orjson` writes NaN/Infinity as null and rejects
+    ints wider than 64 bits and lone surrogates, any of which would make a stored block
+    fail hash verification (or fail to be written) after a reload.
+
+    Args:
+        obj: The JSON-compatible object to serialize.
+
+    Returns:
+        The ASCII encoded JSON record, including the trailing newline.
+    """
+    return (_STORAGE_ENCODER.encode(obj) + "\n").encode("ascii")
+
+def loads_line(line: bytes) -> Any:
+    """
+    Parses a single JSON Lines record produced by `dumps_line`.
+
+    The stdlib decoder is used for the same reason as in `dumps_line`: `orjson` rejects
+    NaN/Infinity and lone surrogates, and silently turns very large ints into floats.
+
+    Args:
+        line: The raw bytes of one record (a trailing newline is allowed).
+
+    Returns:
+        The decoded Python object.
     """
-    Calculates a SHA-256 hash from a given string.
+    return json.loads(line)
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parses a JSON document (e.g. an HTTP or LLM response body), using `orjson` when installed.
+
+    Args:
+        data: The JSON text, as `str` or UTF-8 `bytes`.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        json.JSONDecodeError: If `data` is not valid JSON (orjson's error is a subclass).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def sha256_hex_bytes(b: bytes) -> str:
+    """
+    Calculates a SHA-256 hash from raw bytes.
 
     SHA-256 is selected for its widespread adoption, strong collision resistance, and sufficient security
-    for this application's purpose of data integrity verification.
+    for this application's purpose of data integrity verification. Callers that already hold the
+    serialized form as bytes (e.g. `Block.core_bytes`) should hash it here directly rather than
+    round-tripping through `str`.
+
+    Args:
+        b: The bytes to hash.
+
+    Returns:
+        The hexadecimal representation of the SHA-256 hash.
+    """
+    return hashlib.sha256(b).hexdigest()
+
+def sha256_hex(s: str) -> str:
+    """
+    Calculates a SHA-256 hash from a given string, encoded as UTF-8.
+
+    A thin wrapper over `sha256_hex_bytes`, kept for callers that work with text.
 
     Args:
         s: The string to hash.
@@ -44,17 +123,31 @@ def sha256_hex(s: str) -> str:
     Returns:
         The hexadecimal representation of the SHA-256 hash.
     """
-    return hashlib.sha256(s.encode('utf-8')).hexdigest()
+    return sha256_hex_bytes(s.encode('utf-8'))
+
+# (unix second, "YYYY-MM-DDTHH:MM:SS") for the most recent `utc_iso` call. Stored as one
+# tuple so concurrent callers always see a matching pair.
+_utc_second_cache: Tuple[int, str] = (-1, "")
 
 def utc_iso() -> str:
     """
-    Returns the current time as an ISO 8601 formatted string in UTC.
+    Returns the current time as an ISO 8601 formatted string in UTC, with microseconds
+    (e.g. "2025-08-10T12:34:56.789012").
 
     Using UTC (Coordinated Universal Time) is a best practice for server applications and distributed
     systems, as it provides a universal time standard, free from the ambiguities of time zones and
     daylight saving time.
 
+    The timestamp is formatted from `time.time_ns()` without building a `datetime` object, and the
+    date/time-of-day prefix is reused for calls within the same second.
+
     Returns:
         The current UTC timestamp in ISO 8601 format.
     """
-    return datetime.utcnow().isoformat()
\ No newline at end of file
+    global _utc_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _utc_second_cache
+    if cached_second != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _utc_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
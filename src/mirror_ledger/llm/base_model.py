@@ -1,17 +1,72 @@
 # src/mirror_ledger/llm/base_model.py
-import requests
+import asyncio
+import httpx
 import json
 from typing import Dict, Any, Optional # <-- IMPORT 'Optional'
 
+from mirror_ledger.blockchain.utils import loads_json
+from mirror_ledger.llm.cache import ResultCache
+
 """
 This module contains the LLM 'Generator'.
 This implementation calls a local model served by Ollama to handle high-frequency,
 domain-specific tasks like drafting clinical notes.
+
+Calls are made with an async HTTP client, so a single server worker can keep many
+generations in flight while Ollama is busy; Ollama's scheduler can run concurrent requests
+as one batch. The number in flight per Generator is bounded, so a burst of intakes queues
+here instead of piling up on Ollama.
+
+Successful generations are memoized per (transcript, vitals), so replayed or repeated
+requests do not go back to the model.
 """
 
+# Number of distinct (transcript, vitals) generations kept per Generator.
+_INTAKE_CACHE_SIZE = 4096
+# Local generation can take many seconds; only connecting should fail fast.
+_OLLAMA_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+# Keep the model loaded between requests instead of letting Ollama unload it.
+_OLLAMA_KEEP_ALIVE = "10m"
+# Generations a Generator sends to Ollama at once; further intakes wait for a free slot.
+_MAX_CONCURRENT_GENERATIONS = 8
+# Idle connections to Ollama kept open for reuse by a shared client.
+_MAX_KEEPALIVE_CONNECTIONS = 32
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Creates an HTTP client suited to Ollama calls: generous read timeout and a pool of
+    keep-alive connections, so requests reuse sockets instead of reconnecting. Meant to
+    be created once per process and shared.
+    """
+    return httpx.AsyncClient(
+        timeout=_OLLAMA_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS),
+    )
+
+# The fixed parts of the intake prompt, around the transcript and the vitals JSON.
+_INTAKE_PROMPT_PREFIX = """
+        **Task:** Generate a concise "History of Present Illness" (HPI) summary.
+        **Instructions:**
+        - Use the provided transcript and vitals.
+        - Be objective and clinical in tone.
+        - Do not add information not present in the source.
+        - Structure the output as a JSON object with one key: "hpi_summary".
+
+        **Transcript:**
+        \""""
+_INTAKE_PROMPT_MIDDLE = """"
+
+        **Vitals:**
+        """
+_INTAKE_PROMPT_SUFFIX = """
+
+        **JSON Output:**
+        """
+
 class Generator:
     # VVV --- THIS IS THE LINE WE ARE FIXING --- VVV
-    def __init__(self, model_name: str = "phi3:mini", adapter_id: Optional[str] = None, ollama_url: str = "http://localhost:11434/api/generate"):
+    def __init__(self, model_name: str = "phi3:mini", adapter_id: Optional[str] = None, ollama_url: str = "http://localhost:11434/api/generate", cache_size: int = _INTAKE_CACHE_SIZE, client: Optional[httpx.AsyncClient] = None, max_concurrency: int = _MAX_CONCURRENT_GENERATIONS):
         """
         Initializes the Generator to connect to a local Ollama instance.
 
@@ -19,49 +74,63 @@ class Generator:
             model_name: The name of the model to use in Ollama (e.g., 'phi3:mini').
             adapter_id: The identifier for any PEFT/LoRA adapter being used (for future use).
             ollama_url: The URL of the Ollama API endpoint.
+            cache_size: How many generations to memoize (least recently used are evicted; 0 disables).
+            client: A shared HTTP client to send requests with. The caller keeps ownership
+                and closes it; if omitted, the Generator creates and closes its own.
+            max_concurrency: Maximum number of generations in flight to Ollama at once.
         """
         self.model_name = model_name
         self.adapter_id = adapter_id  # For logging and traceability
         self.url = ollama_url
+        self._cache = ResultCache(cache_size)
+        self._owns_client = client is None
+        self._client = client if client is not None else create_http_client()
+        self._slots = asyncio.Semaphore(max_concurrency)
         print(f"Initialized Ollama Generator with model: '{self.model_name}' at {self.url}")
 
     def _create_prompt(self, transcript: str, vitals: dict) -> str:
         """Creates a structured prompt for the clinical intake task."""
-        return f"""
-        **Task:** Generate a concise "History of Present Illness" (HPI) summary.
-        **Instructions:**
-        - Use the provided transcript and vitals.
-        - Be objective and clinical in tone.
-        - Do not add information not present in the source.
-        - Structure the output as a JSON object with one key: "hpi_summary".
+        return "".join((_INTAKE_PROMPT_PREFIX, transcript, _INTAKE_PROMPT_MIDDLE, json.dumps(vitals), _INTAKE_PROMPT_SUFFIX))
 
-        **Transcript:**
-        "{transcript}"
-
-        **Vitals:**
-        {json.dumps(vitals)}
-
-        **JSON Output:**
-        """
+    async def aclose(self) -> None:
+        """Closes the HTTP client and its pooled connections, if this Generator created it."""
+        if self._owns_client:
+            await self._client.aclose()
 
-    def generate_intake(self, transcript: str, vitals: dict) -> Dict[str, Any]:
+    async def generate_intake(self, transcript: str, vitals: dict) -> Dict[str, Any]:
         """
         Generates a structured HPI summary by calling the Ollama API.
+        Failed generations are returned but never cached.
         """
+        key = (transcript, json.dumps(vitals, sort_keys=True))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        async with self._slots:
+            result = await self._generate(transcript, vitals)
+        if "error" not in result:
+            self._cache.put(key, result)
+        return result
+
+    async def _generate(self, transcript: str, vitals: dict) -> Dict[str, Any]:
+        """Calls the Ollama API for one intake (uncached)."""
         print(f"Generator: Generating intake for transcript: '{transcript[:30]}...'")
         prompt = self._create_prompt(transcript, vitals)
+        response_text = None  # The text being decoded, for the error message
 
         try:
-            response = requests.post(
+            response = await self._client.post(
                 self.url,
-                json={"model": self.model_name, "prompt": prompt, "stream": False, "format": "json"},
+                json={"model": self.model_name, "prompt": prompt, "stream": False, "format": "json", "keep_alive": _OLLAMA_KEEP_ALIVE},
                 headers={"Content-Type": "application/json"}
             )
             response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
 
             # Ollama returns the JSON response as a string in the 'response' key.
-            response_text = response.json().get("response", "{}")
-            generated_content = json.loads(response_text)
+            response_text = response.text
+            response_text = loads_json(response_text).get("response", "{}")
+            generated_content = loads_json(response_text)
 
             # Combine source data with the LLM's generation for a complete record.
             return {
@@ -70,10 +139,10 @@ class Generator:
                 **generated_content  # Merge the generated hpi_summary
             }
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"ERROR: Could not connect to Ollama. Is it running? Details: {e}")
             # Fallback to a failure message in the content
             return {"error": "Failed to generate content due to connection error.", "hpi_summary": "GENERATION FAILED."}
         except json.JSONDecodeError as e:
             print(f"ERROR: Failed to decode JSON from Ollama response: {response_text}. Details: {e}")
-            return {"error": "Failed to decode LLM output.", "hpi_summary": "GENERATION FAILED - INVALID FORMAT."}
\ No newline at end of file
+            return {"error": "Failed to decode LLM output.", "hpi_summary": "GENERATION FAILED - INVALID FORMAT."}
@@ -0,0 +1,47 @@
+# src/mirror_ledger/llm/cache.py
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from mirror_ledger.blockchain.utils import deterministic_dumps, sha256_hex
+
+"""
+A small in-memory LRU cache for LLM results. Model calls take hundreds of milliseconds
+to seconds, so repeated inputs (retries, replays, dashboard resubmits) are answered from
+memory instead. Cached results are JSON-like dicts; callers get shallow copies.
+"""
+
+
+def payload_key(payload: Any) -> str:
+    """A compact cache key for a JSON-serializable payload: the SHA-256 of its canonical JSON."""
+    return sha256_hex(deterministic_dumps(payload))
+
+
+class ResultCache:
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: Maximum number of entries; the least recently used are evicted first.
+                0 disables the cache.
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the cached result for `key`, or None on a miss."""
+        result = self._entries.get(key)
+        if result is None:
+            return None
+        self._entries.move_to_end(key)
+        return dict(result)  # Shallow copy, so callers can't alter the cached entry
+
+    def put(self, key: Hashable, result: Dict[str, Any]) -> None:
+        """Stores a copy of `result` under `key`, evicting the oldest entry if full."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = dict(result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -1,54 +1,59 @@
 # src/mirror_ledger/llm/reflection_model.py
+import asyncio
 import os
 import json
 from typing import Dict, Any, List
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from mirror_ledger.reflection.constitution import THE_CONSTITUTION
+from mirror_ledger.blockchain.utils import loads_json
+from mirror_ledger.llm.cache import ResultCache, payload_key
 
 """
 This module provides the 'Reflector' class, acting as the 'Overlord Model'.
 It uses a powerful external LLM (Google's Gemini) to perform a nuanced,
 principle-based evaluation of the action model's output, judging it against
 the system's moral constitution.
+
+Verdicts are memoized by a hash of the payload's canonical JSON, so identical content
+(retries, replays) is not sent to Gemini twice.
 """
 
+# Number of distinct payload verdicts kept per Reflector.
+_JUDGE_CACHE_SIZE = 4096
+# JSON mode: Gemini returns the bare verdict object instead of a markdown-fenced block.
+_GENERATION_CONFIG = {"response_mime_type": "application/json"}
+# A judge call may not hold a request longer than this per attempt; timeouts and 5xx
+# responses are retried _JUDGE_RETRIES times, backing off exponentially from _JUDGE_BACKOFF_S.
+_JUDGE_TIMEOUT_S = 8.0
+_JUDGE_RETRIES = 2
+_JUDGE_BACKOFF_S = 0.2
+
 def _format_constitution_for_prompt() -> str:
     """Formats the constitution into a string for the LLM prompt."""
-    prompt_part = ""
-    for axiom in THE_CONSTITUTION:
-        prompt_part += f"- Principle: {axiom['principle']}\n"
-        prompt_part += "  Rules:\n"
-        for rule_key, rule_desc in axiom['rules'].items():
-            prompt_part += f"    - {rule_desc}\n"
-    return prompt_part
+    return "".join(
+        f"- Principle: {axiom['principle']}\n  Rules:\n"
+        + "".join(f"    - {rule_desc}\n" for rule_desc in axiom['rules'].values())
+        for axiom in THE_CONSTITUTION
+    )
 
-class Reflector:
-    def __init__(self, model_name: str = "gemini-1.5-flash"):
-        """
-        Initializes the Reflector with a connection to the Google Gemini API.
-        """
-        self.model_name = model_name
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY environment variable not set.")
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(self.model_name)
-        self.constitution_prompt = _format_constitution_for_prompt()
-        print(f"Initialized Gemini Reflector with model: '{self.model_name}'")
+# The constitution is static, so its prompt rendering is built once per process.
+_CONSTITUTION_PROMPT = _format_constitution_for_prompt()
 
-    def _create_prompt(self, payload: Dict[str, Any]) -> str:
-        """Creates the full judgment prompt for the Gemini model."""
-        content_to_judge = json.dumps(payload, indent=2)
-        return f"""
-        **Task:** Act as a moral and ethical evaluator for an AI system.
-        **Your Constitution:**
-        You must strictly adhere to the following principles:
-        {self.constitution_prompt}
+_SYSTEM_INSTRUCTION_TEMPLATE = """
+**Task:** Act as a moral and ethical evaluator for an AI system.
+**Your Constitution:**
+You must strictly adhere to the following principles:
+{constitution}
+"""
 
+# The fixed parts of the per-call judge prompt, around the payload JSON.
+_JUDGE_PROMPT_PREFIX = """
         **AI Output to Evaluate:**
         ```json
-        {content_to_judge}
+        """
+_JUDGE_PROMPT_SUFFIX = """
         ```
 
         **Your Response:**
@@ -60,19 +65,57 @@ class Reflector:
         **JSON Response:**
         """
 
-    def judge(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+class Reflector:
+    def __init__(self, model_name: str = "gemini-1.5-flash", cache_size: int = _JUDGE_CACHE_SIZE):
+        """
+        Initializes the Reflector with a connection to the Google Gemini API.
+
+        Args:
+            model_name: The Gemini model to judge with.
+            cache_size: How many verdicts to memoize (least recently used are evicted; 0 disables).
+        """
+        self.model_name = model_name
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY environment variable not set.")
+        genai.configure(api_key=api_key)
+        self.constitution_prompt = _CONSTITUTION_PROMPT
+        # The constitution is static, so it is rendered once and bound to the model as its
+        # system instruction; the per-call prompt only carries the payload being evaluated.
+        self.model = genai.GenerativeModel(
+            self.model_name,
+            system_instruction=_SYSTEM_INSTRUCTION_TEMPLATE.format(constitution=self.constitution_prompt),
+            generation_config=_GENERATION_CONFIG,
+        )
+        self._cache = ResultCache(cache_size)
+        print(f"Initialized Gemini Reflector with model: '{self.model_name}'")
+
+    def _create_prompt(self, payload: Dict[str, Any]) -> str:
+        """Creates the per-call judgment prompt (the constitution is in the system instruction)."""
+        # Compact JSON: indentation only adds input tokens.
+        content_to_judge = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return "".join((_JUDGE_PROMPT_PREFIX, content_to_judge, _JUDGE_PROMPT_SUFFIX))
+
+    async def judge(self, payload: Dict[str, Any], no_cache: bool = False) -> Dict[str, Any]:
         """
         Wraps the call to the Gemini API to judge the payload against the constitution.
+        Set `no_cache` to force a fresh verdict (e.g., for audits); failures are never cached.
         """
+        key = payload_key(payload)
+        if not no_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
         print("Reflector: Judging payload with Gemini API...")
         prompt = self._create_prompt(payload)
 
         try:
-            response = self.model.generate_content(prompt)
-            # The API returns markdown with a JSON block, so we clean it up.
-            response_text = response.text.strip().replace("```json", "").replace("```", "")
-            evaluation = json.loads(response_text)
+            response = await self._generate(prompt)
+            evaluation = loads_json(response.text)
             print("Reflector: Received evaluation from Gemini.")
+            if isinstance(evaluation, dict):
+                self._cache.put(key, evaluation)
             return evaluation
 
         except Exception as e:
@@ -82,3 +125,18 @@ class Reflector:
                 "ok": False,
                 "violations": [f"Reflector Failure: Could not evaluate content due to API error: {e}"]
             }
+
+    async def _generate(self, prompt: str) -> Any:
+        """Calls Gemini with a bounded timeout, retrying transient failures (timeouts, 5xx)."""
+        for attempt in range(_JUDGE_RETRIES + 1):
+            try:
+                # The outer wait_for is a backstop in case the transport ignores its timeout.
+                return await asyncio.wait_for(
+                    self.model.generate_content_async(prompt, request_options={"timeout": _JUDGE_TIMEOUT_S}),
+                    timeout=_JUDGE_TIMEOUT_S + 2.0,
+                )
+            except (asyncio.TimeoutError, google_exceptions.ServerError) as e:
+                if attempt == _JUDGE_RETRIES:
+                    raise
+                print(f"Reflector: Transient Gemini error ({e!r}); retrying.")
+                await asyncio.sleep(_JUDGE_BACKOFF_S * 2 ** attempt)
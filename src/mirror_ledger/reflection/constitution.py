@@ -35,7 +35,7 @@ AXIOM_TRUTH_TELLING = {
         "promote_honesty": "Outputs should strive for accuracy, clarity, and honesty, acknowledging uncertainty where it exists."
     },
     "keywords_indicative_of_violation": [
-        "secretly a lizard", "is a known fraud" # (Used in a context of baseless accusation)
+        "secretly a lizard", "is a known fraud", # (Used in a context of baseless accusation)
         "lie about", "deceive them by", "manipulate them into"
     ]
 }
@@ -76,4 +76,10 @@ THE_CONSTITUTION = [
     AXIOM_TRUTH_TELLING,
     NORM_MATTHEW_18,
     NORM_FRUIT_OF_THE_SPIRIT,
-]
\ No newline at end of file
+]
+
+# Keywords are matched case-insensitively; lowercase them once here rather than on
+# every evaluation. Stored alongside the originals, in the same order.
+for _rule in THE_CONSTITUTION:
+    _rule["_keywords_lower"] = tuple(k.lower() for k in _rule.get("keywords_indicative_of_violation", []))
+del _rule
@@ -1,14 +1,51 @@
 # mirror_ledger/reflection/evaluator.py
 
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 from .constitution import THE_CONSTITUTION
 
 """
 This module implements the core reflection engine. It's responsible for evaluating
 a data payload against the established moral constitution.
+
+All violation keywords are compiled once, at import, into a single regular expression,
+so a payload is scanned in one pass regardless of how many rules the constitution has.
 """
 
+
+def _build_keyword_matcher(
+    constitution: List[Dict[str, Any]],
+) -> Tuple[Optional[re.Pattern], Dict[str, Set[str]], List[Tuple[Dict[str, Any], List[Tuple[str, str]]]]]:
+    """
+    Precomputes everything `evaluate_output` needs to scan text for constitutional keywords.
+
+    Returns:
+        - A compiled pattern matching any lowercased keyword at any position (a lookahead,
+          so overlapping keywords are all found), or None if there are no keywords.
+        - For each lowercased keyword, the set of keywords it implies, i.e. every keyword
+          that is a substring of it (including itself). The regex reports one keyword per
+          position, so a shorter keyword hidden inside a longer match is recovered here.
+        - The rules paired with their (lowercased, original) keywords, in constitution order.
+    """
+    rule_keywords = [
+        (rule, list(zip(rule.get("_keywords_lower", ()), rule.get("keywords_indicative_of_violation", []))))
+        for rule in constitution
+    ]
+    lowered = {kw_lower for _, keywords in rule_keywords for kw_lower, _ in keywords}
+    if not lowered:
+        return None, {}, rule_keywords
+
+    # Longest first, so a keyword is preferred over any of its prefixes at the same position.
+    alternation = "|".join(re.escape(kw) for kw in sorted(lowered, key=len, reverse=True))
+    pattern = re.compile(f"(?=({alternation}))")
+    implied = {kw: {other for other in lowered if other in kw} for kw in lowered}
+    return pattern, implied, rule_keywords
+
+
+_KEYWORD_PATTERN, _IMPLIED_KEYWORDS, _RULE_KEYWORDS = _build_keyword_matcher(THE_CONSTITUTION)
+
+
 def evaluate_output(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Evaluates a given data payload against the rules in THE_CONSTITUTION.
@@ -26,22 +63,26 @@ def evaluate_output(payload: Dict[str, Any]) -> Dict[str, Any]:
     violations = []
     text_to_check = str(payload.get("hpi_summary", "")) # Focus on a specific field for now
 
-    if not text_to_check:
+    if not text_to_check or _KEYWORD_PATTERN is None:
         return {"ok": True, "violations": []}
 
-    for rule in THE_CONSTITUTION:
-        for keyword in rule.get("keywords", []):
-            if keyword.lower() in text_to_check.lower():
-                violations.append({
-                    "id": rule["id"],
-                    "severity": rule["severity"],
-                    "principle": rule["principle"],
-                    "explanation": rule["explanation"],
-                    "trigger_keyword": keyword
-                })
+    found: Set[str] = set()
+    for match in _KEYWORD_PATTERN.finditer(text_to_check.lower()):
+        found |= _IMPLIED_KEYWORDS[match.group(1)]
+
+    # Report in constitution order, one violation per (rule, keyword) present in the text.
+    if found:
+        for rule, keywords in _RULE_KEYWORDS:
+            for kw_lower, keyword in keywords:
+                if kw_lower in found:
+                    violations.append({
+                        "principle": rule["principle"],
+                        "severity": rule.get("severity", "block"),
+                        "trigger_keyword": keyword
+                    })
 
     # The output is considered "not ok" only if it contains a "block" severity violation.
     # Warnings are logged but do not cause an immediate failure.
     is_ok = not any(v["severity"] == "block" for v in violations)
 
-    return {"ok": is_ok, "violations": violations}
\ No newline at end of file
+    return {"ok": is_ok, "violations": violations}
@@ -13,7 +13,6 @@ from datetime import datetime
 # You can override this with an environment variable if needed.
 import os
 API_BASE_URL = os.getenv("MIRROR_LEDGER_API_URL", "http://127.0.0.1:8000")
-ADAPTATION_THRESHOLD = 3 # As defined in your server's policy
 
 st.set_page_config(
     page_title="Mirror Ledger Dashboard",
@@ -32,15 +31,28 @@ def get_api_status():
     except requests.RequestException:
         return False
 
-def get_chain():
-    """Fetches the entire blockchain from the API."""
+def get_chain(since_index: int = 0):
+    """Fetches the blockchain from `since_index` onward from the API's NDJSON stream."""
+    blocks = []
     try:
-        response = requests.get(f"{API_BASE_URL}/chain")
-        response.raise_for_status()
-        return response.json().get("chain", [])
+        with requests.get(f"{API_BASE_URL}/chain/stream", params={"since_index": since_index}, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    blocks.append(json.loads(line))
     except (requests.RequestException, json.JSONDecodeError) as e:
         st.error(f"Error fetching chain: {e}")
-        return []
+    return blocks
+
+def get_adaptation_status():
+    """Fetches the adaptation policy's progress (corrections vs. threshold) from the API."""
+    try:
+        response = requests.get(f"{API_BASE_URL}/adaptation/status")
+        response.raise_for_status()
+        return response.json()
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        st.error(f"Error fetching adaptation status: {e}")
+        return None
 
 def post_intake_draft(trace_id: str, transcript: str, vitals: dict):
     """Posts a new clinical intake event to the API."""
@@ -69,11 +81,38 @@ def post_feedback(block_index: int, feedback_delta: dict):
         response = requests.post(f"{API_BASE_URL}/feedback", json=payload)
         response.raise_for_status()
         st.toast(f"✅ Feedback submitted for Block #{block_index}")
-        return response.json()
+        updated_block = response.json()
+        # Refreshing only fetches new blocks, so keep the cached copy's feedback current here.
+        chain_cache = st.session_state.get("chain_cache")
+        if chain_cache is not None and block_index < len(chain_cache):
+            chain_cache[block_index] = updated_block
+            mark_chain_changed()
+        return updated_block
     except requests.RequestException as e:
         st.error(f"Error submitting feedback: {e.text}")
         return None
 
+def get_chain_frame() -> pd.DataFrame:
+    """
+    Returns a DataFrame of the cached chain's filterable fields, one row per block (row
+    label == chain position). It is rebuilt only when the cached chain changes, so pages
+    filter with vectorized comparisons instead of walking every block dict per render.
+    """
+    chain = st.session_state.get('chain_cache', [])
+    version = st.session_state.get('chain_version', 0)
+    if st.session_state.get('chain_frame_version') != version or 'chain_frame' not in st.session_state:
+        st.session_state.chain_frame = pd.DataFrame({
+            "index": [b['index'] for b in chain],
+            "type": [b.get('data', {}).get('type') for b in chain],
+            "trace_id": [b.get('data', {}).get('trace_id') for b in chain],
+        })
+        st.session_state.chain_frame_version = version
+    return st.session_state.chain_frame
+
+def mark_chain_changed():
+    """Marks the cached chain as modified, so the next get_chain_frame() rebuilds."""
+    st.session_state.chain_version = st.session_state.get('chain_version', 0) + 1
+
 # --- Page Rendering ---
 
 def render_playground():
@@ -146,14 +185,13 @@ def render_ledger_explorer():
     st.markdown("View, search, and interact with the entire, immutable history of the system.")
     
     chain = st.session_state.get('chain_cache', [])
+    df = get_chain_frame()
 
     # Filter controls
     search_trace_id = st.text_input("Filter by Trace ID")
     
-    filtered_chain = [
-        b for b in chain 
-        if not search_trace_id or b.get('data', {}).get('trace_id') == search_trace_id
-    ]
+    positions = df.index[df["trace_id"] == search_trace_id] if search_trace_id else df.index
+    filtered_chain = [chain[i] for i in positions]
 
     if not filtered_chain:
         st.info("No blocks found or chain is empty.")
@@ -196,32 +234,27 @@ def render_adaptation_dashboard():
         st.info("No data available.")
         return
 
-    # Find the index of the last adaptation event
-    last_adapt_index = -1
-    for block in reversed(chain):
-        if block.get('data', {}).get('type') == 'AdapterPromoted':
-            last_adapt_index = block['index']
-            break
-
-    # Count corrections since the last adaptation
-    corrections_since_last_adapt = 0
-    for block in chain[last_adapt_index + 1:]:
-        if "correction" in block.get("feedback", {}):
-            corrections_since_last_adapt += 1
+    # The server keeps these counters up to date, so there is no chain scan here.
+    status = get_adaptation_status()
+    if status is None:
+        return
+    corrections_since_last_adapt = status["corrections_since"]
+    threshold = status["threshold"]
     
     st.subheader("Next Adaptation Progress")
-    progress = min(corrections_since_last_adapt / ADAPTATION_THRESHOLD, 1.0)
+    progress = min(corrections_since_last_adapt / threshold, 1.0)
     st.progress(progress)
     st.metric(
         label="Feedback for Next Adaptation Cycle",
-        value=f"{corrections_since_last_adapt} / {ADAPTATION_THRESHOLD}",
-        delta="Triggered!" if progress >= 1.0 else f"{ADAPTATION_THRESHOLD - corrections_since_last_adapt} more needed"
+        value=f"{corrections_since_last_adapt} / {threshold}",
+        delta="Triggered!" if progress >= 1.0 else f"{threshold - corrections_since_last_adapt} more needed"
     )
 
     st.markdown("---")
     st.subheader("Adaptation History")
     
-    adapt_events = [b for b in chain if b.get('data', {}).get('type') == 'AdapterPromoted']
+    df = get_chain_frame()
+    adapt_events = [chain[i] for i in df.index[df["type"] == 'AdapterPromoted']]
 
     if not adapt_events:
         st.info("No adaptation events have occurred yet.")
@@ -248,8 +281,16 @@ def main():
     if api_is_online:
         st.sidebar.success("✅ Backend API is Online")
         # Cache the chain in session state to reduce API calls
-        if 'chain_cache' not in st.session_state or st.sidebar.button('🔄 Refresh Data'):
+        refresh = st.sidebar.button('🔄 Refresh Data')
+        full_reload = st.sidebar.button('♻️ Full Reload')
+        if 'chain_cache' not in st.session_state or full_reload:
             st.session_state.chain_cache = get_chain()
+            mark_chain_changed()
+        elif refresh:
+            # Blocks are append-only, so only the ones not cached yet are fetched. Feedback
+            # merged into cached blocks by other clients shows up after a full reload.
+            st.session_state.chain_cache.extend(get_chain(since_index=len(st.session_state.chain_cache)))
+            mark_chain_changed()
     else:
         st.sidebar.error("❌ Backend API is Offline")
         st.error("Could not connect to the Mirror Ledger API. Please ensure the FastAPI server is running.")
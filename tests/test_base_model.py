@@ -0,0 +1,73 @@
+# tests/test_base_model.py
+import asyncio
+import json
+
+import httpx
+
+from mirror_ledger.llm.base_model import Generator
+
+
+def _generator(handler, **kwargs) -> Generator:
+    """A Generator whose Ollama calls are answered by `handler` instead of the network."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return Generator(client=client, cache_size=0, **kwargs)
+
+
+def test_generate_intake_merges_generated_content():
+    body = {"response": json.dumps({"hpi_summary": "Headache for 2 days."})}
+    generator = _generator(lambda request: httpx.Response(200, json=body))
+
+    result = asyncio.run(generator.generate_intake("my head hurts", {"bp": "120/80"}))
+
+    assert result == {
+        "source_transcript": "my head hurts",
+        "source_vitals": {"bp": "120/80"},
+        "hpi_summary": "Headache for 2 days.",
+    }
+
+
+def test_non_json_envelope_returns_failsafe():
+    generator = _generator(lambda request: httpx.Response(200, text="<html>502 Bad Gateway</html>"))
+
+    result = asyncio.run(generator.generate_intake("my head hurts", {}))
+
+    assert result["hpi_summary"] == "GENERATION FAILED - INVALID FORMAT."
+    assert "error" in result
+
+
+def test_non_json_generation_returns_failsafe():
+    generator = _generator(lambda request: httpx.Response(200, json={"response": "not json"}))
+
+    result = asyncio.run(generator.generate_intake("my head hurts", {}))
+
+    assert result["hpi_summary"] == "GENERATION FAILED - INVALID FORMAT."
+
+
+def test_http_error_returns_failsafe():
+    generator = _generator(lambda request: httpx.Response(500, text="boom"))
+
+    result = asyncio.run(generator.generate_intake("my head hurts", {}))
+
+    assert result["hpi_summary"] == "GENERATION FAILED."
+
+
+def test_in_flight_generations_are_bounded():
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"response": json.dumps({"hpi_summary": "ok"})})
+
+    generator = _generator(handler, max_concurrency=2)
+
+    async def burst():
+        return await asyncio.gather(*(generator.generate_intake(f"t{i}", {}) for i in range(6)))
+
+    results = asyncio.run(burst())
+
+    assert [r["hpi_summary"] for r in results] == ["ok"] * 6
+    assert peak == 2
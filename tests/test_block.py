@@ -0,0 +1,43 @@
+# tests/test_block.py
+import hashlib
+import json
+
+import pytest
+
+from mirror_ledger.blockchain.block import Block
+
+
+def _reference_hash(block: Block) -> str:
+    """The block hash as originally defined: SHA-256 of the canonical JSON of core_dict()."""
+    canonical = json.dumps(block.core_dict(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@pytest.mark.parametrize("data", [
+    {},
+    {"type": "IntakeDrafted", "trace_id": "t-1", "content": {"hpi_summary": "Headache."}},
+    {"text": "café ünïcode 日本語 🚑"},
+    {"text": "lone surrogates \ud800 and \udfff"},
+    {"values": [float("nan"), float("inf"), float("-inf"), -0.0, 1e300]},
+    {"big": 2 ** 80, "negative": -(2 ** 70)},
+    {"z": {"b": [1, {"y": None, "x": True}], "a": {"nested": {"deeper": ["é"]}}}, "a": 1},
+    {"quotes": "\"\\/\b\f\n\r\t\x00"},
+])
+def test_compute_hash_matches_canonical_json(data):
+    block = Block(index=7, previous_hash="ab" * 32, data=data, timestamp="2025-08-10T12:34:56.789012")
+
+    assert block.compute_hash() == _reference_hash(block)
+    assert block.hash == block.compute_hash()
+
+
+def test_compute_hash_matches_canonical_json_for_odd_top_level_strings():
+    block = Block(index=0, previous_hash="0" * 64, data={"k": "v"}, timestamp="té\"\ud800")
+
+    assert block.compute_hash() == _reference_hash(block)
+
+
+def test_feedback_does_not_change_the_hash():
+    block = Block(index=1, previous_hash="0" * 64, data={"type": "Intake"})
+    updated = block.clone_with_feedback({"status": "approved"})
+
+    assert updated.hash == block.hash == _reference_hash(updated)
@@ -0,0 +1,173 @@
+import logging
+
+import pytest
+
+from mirror_ledger.blockchain.ledger import BlockchainLedger
+from mirror_ledger.blockchain.utils import dumps_line
+
+
+def test_replay_skips_feedback_for_missing_blocks(tmp_path, caplog):
+    path = tmp_path / "blocks.jsonl"
+    ledger = BlockchainLedger(storage_path=str(path))
+    block = ledger.add_block({"type": "Intake", "trace_id": "t0"})
+    ledger.append_feedback(block.index, {"status": "reviewed"})
+    ledger.close()
+
+    # A sidecar record pointing past the end of the main file, e.g. after a restore.
+    with ledger.fb_path.open("ab") as f:
+        f.write(dumps_line({"index": block.index + 5, "delta": {"status": "stale"}, "ts": "x"}))
+
+    with caplog.at_level(logging.WARNING, logger="mirror_ledger.blockchain.ledger"):
+        reloaded = BlockchainLedger(storage_path=str(path))
+
+    assert len(reloaded.chain) == 2
+    assert reloaded.chain[block.index].feedback["status"] == "reviewed"
+    assert "missing block" in caplog.text
+    assert reloaded.validate_chain()
+    reloaded.close()
+
+
+def test_orphaned_feedback_is_not_applied_to_later_blocks(tmp_path, caplog):
+    path = tmp_path / "blocks.jsonl"
+    ledger = BlockchainLedger(storage_path=str(path))
+    backup = path.read_bytes()  # Genesis only
+    block = ledger.add_block({"type": "Intake", "trace_id": "t0"})
+    ledger.append_feedback(block.index, {"status": "approved", "correction": "old"})
+    ledger.close()
+
+    # Restore the older main file; the sidecar still refers to the lost block.
+    path.write_bytes(backup)
+    with caplog.at_level(logging.WARNING, logger="mirror_ledger.blockchain.ledger"):
+        restored = BlockchainLedger(storage_path=str(path))
+    assert "missing block" in caplog.text
+    new_block = restored.add_block({"type": "NEW"})
+    restored.close()
+
+    reloaded = BlockchainLedger(storage_path=str(path))
+    assert new_block.index == block.index
+    assert reloaded.chain[new_block.index].feedback == {}
+    assert reloaded.find_by_feedback_status("approved") == []
+    reloaded.close()
+
+
+def test_feedback_for_a_replaced_block_is_dropped(tmp_path):
+    path = tmp_path / "blocks.jsonl"
+    ledger = BlockchainLedger(storage_path=str(path))
+    block = ledger.add_block({"type": "Intake", "trace_id": "t0"})
+    ledger.append_feedback(block.index, {"status": "reviewed"})
+    ledger.close()
+
+    # A record aimed at a different block that once held the same index.
+    with ledger.fb_path.open("ab") as f:
+        f.write(dumps_line({"index": block.index, "hash": "0" * 64, "delta": {"status": "approved"}, "ts": "x"}))
+
+    reloaded = BlockchainLedger(storage_path=str(path))
+    assert reloaded.chain[block.index].feedback == {"status": "reviewed"}
+    assert b'"approved"' not in reloaded.fb_path.read_bytes()
+    reloaded.close()
+
+
+def test_compact_folds_feedback_into_the_main_file(tmp_path):
+    path = tmp_path / "blocks.jsonl"
+    ledger = BlockchainLedger(storage_path=str(path))
+    block = ledger.add_block({"type": "Intake", "trace_id": "t0"})
+    ledger.append_feedback(block.index, {"status": "approved"})
+    ledger.compact()
+    assert not ledger.fb_path.exists()
+    ledger.append_feedback(block.index, {"note": "after compact"})
+    ledger.close()
+
+    reloaded = BlockchainLedger(storage_path=str(path))
+    assert reloaded.chain[block.index].feedback == {"status": "approved", "note": "after compact"}
+    assert reloaded.validate_chain()
+    reloaded.close()
+
+
+def test_validate_chain_catches_rehashed_tampering(tmp_path):
+    ledger = BlockchainLedger(storage_path=str(tmp_path / "blocks.jsonl"))
+    for i in range(3):
+        ledger.add_block({"type": "Intake", "trace_id": f"t{i}", "v": i})
+
+    # Rewrite a block's payload and recompute its hash, so only the next link breaks.
+    block = ledger.chain[2]
+    block.data["v"] = "evil"
+    block.hash = block.compute_hash()
+
+    with pytest.raises(ValueError, match="Chain link broken at Block 3"):
+        ledger.validate_chain()
+    ledger.close()
+
+
+def test_iter_feedback_log_yields_records_in_write_order(tmp_path):
+    ledger = BlockchainLedger(storage_path=str(tmp_path / "blocks.jsonl"), write_buffer_size=4096)
+    block = ledger.add_block({"type": "Intake", "trace_id": "t0"})
+    ledger.append_feedback(block.index, {"correction": "a"})
+    ledger.append_feedback(block.index, {"correction": "b"})
+
+    records = list(ledger.iter_feedback_log())
+    assert [r["delta"] for r in records] == [{"correction": "a"}, {"correction": "b"}]
+    assert all(r["index"] == block.index and r["hash"] == block.hash for r in records)
+    assert records[0]["ts"] > block.timestamp
+    ledger.close()
+
+
+def test_unbuffered_ledger_writes_each_record_through(tmp_path):
+    path = tmp_path / "blocks.jsonl"
+    ledger = BlockchainLedger(storage_path=str(path))
+    block = ledger.add_block({"type": "Intake", "trace_id": "t0"})
+    ledger.append_feedback(block.index, {"status": "reviewed"})
+
+    # Without flush() or close(), both records are already in the files.
+    assert path.read_bytes().splitlines()[-1] == dumps_line(block.to_dict()).rstrip(b"\n")
+    assert b'"reviewed"' in ledger.fb_path.read_bytes()
+    ledger.close()
+
+
+def test_add_blocks_chains_a_batch_after_the_tip(tmp_path):
+    path = tmp_path / "blocks.jsonl"
+    ledger = BlockchainLedger(storage_path=str(path))
+    tip = ledger.add_block({"type": "Intake", "trace_id": "t0"})
+
+    blocks = ledger.add_blocks({"type": "Bulk", "trace_id": f"b{i}"} for i in range(3))
+
+    assert [b.index for b in blocks] == [2, 3, 4]
+    assert blocks[0].previous_hash == tip.hash
+    assert [b.index for b in ledger.find_by_type("Bulk")] == [2, 3, 4]
+    assert ledger.add_blocks([]) == []
+    ledger.close()
+
+    reloaded = BlockchainLedger(storage_path=str(path))
+    assert [b.hash for b in reloaded.chain[2:]] == [b.hash for b in blocks]
+    assert reloaded.validate_chain()
+    reloaded.close()
+
+
+def test_replay_applies_feedback_in_write_order(tmp_path):
+    path = tmp_path / "blocks.jsonl"
+    ledger = BlockchainLedger(storage_path=str(path))
+    block = ledger.add_block({"type": "Intake", "trace_id": "t0"})
+    ledger.append_feedback(block.index, {"status": "pending", "note": "first"})
+    ledger.append_feedback(block.index, {"status": "approved"})
+    ledger.close()
+
+    reloaded = BlockchainLedger(storage_path=str(path))
+    assert reloaded.chain[block.index].feedback == {"status": "approved", "note": "first"}
+    assert [b.index for b in reloaded.find_by_feedback_status("approved")] == [block.index]
+    assert reloaded.find_by_feedback_status("pending") == []
+    assert reloaded.chain[block.index].hash == block.hash
+    reloaded.close()
+
+
+def test_validate_chain_reports_the_lowest_failing_block(tmp_path):
+    ledger = BlockchainLedger(storage_path=str(tmp_path / "blocks.jsonl"))
+    for i in range(5):
+        ledger.add_block({"type": "Intake", "trace_id": f"t{i}"})
+
+    # Rehash Block 1 so only the link at Block 2 breaks, and corrupt a later block's hash.
+    ledger.chain[1].data["trace_id"] = "evil"
+    ledger.chain[1].hash = ledger.chain[1].compute_hash()
+    ledger.chain[4].data["trace_id"] = "evil"
+
+    with pytest.raises(ValueError, match="Chain link broken at Block 2"):
+        ledger.validate_chain()
+    ledger.close()